@@ -1,29 +1,98 @@
 import graphene
 import mongoengine
-import uuid
+import weakref
 
+from functools import wraps
 from graphene.types.json import JSONString
 from mongoengine.base import get_document
 
 from . import advanced_types
 from .helper_fields import MapField
-from .utils import import_single_dispatch, get_field_description
-
-singledispatch = import_single_dispatch()
+from .utils import get_field_description
 
 
 class MongoEngineConversionError(Exception):
     pass
 
 
-@singledispatch
-def convert_mongoengine_field(field, registry=None):
+def memoize_conversion(converter):
+    """
+    Caches the result of converting a MongoEngine field per (field, registry) pair.
+
+    Entries are held weakly by field. Dynamic results close over their field
+    and would keep it alive, so they are converted again on every call.
+    Conversions can depend on which types are registered, so the registry
+    clears the cache through ``cache_clear`` every time a type is registered.
+    """
+    cache = weakref.WeakKeyDictionary()
+
+    @wraps(converter)
+    def memoized(field, registry=None):
+        try:
+            results = cache.get(field)
+        except TypeError:
+            # Unhashable or non weak-referenceable field, don't cache it.
+            return converter(field, registry)
+        if results is not None and registry in results:
+            return results[registry]
+        converted = converter(field, registry)
+        if not isinstance(converted, graphene.Dynamic):
+            cache.setdefault(field, {})[registry] = converted
+        return converted
+
+    memoized.cache_clear = cache.clear
+    return memoized
+
+
+# Converters registered per MongoEngine field class, and resolved per concrete
+# field class (walking its MRO) the first time that class is seen.
+_CONVERTERS = {}
+_MRO_CACHE = {}
+
+# Union types built for generic fields, by owner document, field and member types.
+_UNION_CACHE = {}
+
+
+def _convert_unknown_field(field, registry=None):
     raise MongoEngineConversionError(
         "Don't know how to convert the MongoEngine field %s (%s)"
         % (field, field.__class__)
     )
 
 
+def _dispatch(field_class):
+    try:
+        return _MRO_CACHE[field_class]
+    except KeyError:
+        pass
+    converter = _convert_unknown_field
+    for base in field_class.__mro__:
+        if base in _CONVERTERS:
+            converter = _CONVERTERS[base]
+            break
+    _MRO_CACHE[field_class] = converter
+    return converter
+
+
+def _register(field_class):
+    def decorator(converter):
+        _CONVERTERS[field_class] = converter
+        _MRO_CACHE.clear()
+        convert_mongoengine_field.cache_clear()
+        return converter
+
+    return decorator
+
+
+@memoize_conversion
+def convert_mongoengine_field(field, registry=None):
+    return _dispatch(type(field))(field, registry)
+
+
+convert_mongoengine_field.register = _register
+convert_mongoengine_field.dispatch = _dispatch
+
+
 @convert_mongoengine_field.register(mongoengine.EmailField)
 @convert_mongoengine_field.register(mongoengine.StringField)
 @convert_mongoengine_field.register(mongoengine.URLField)
@@ -181,14 +250,15 @@ def convert_field_to_union(field, registry=None):
     if len(_types) == 0:
         return None
 
-    # XXX: Use uuid to avoid duplicate name
-    name = "{}_{}_union_{}".format(
-        field._owner_document.__name__,
-        field.db_field,
-        str(uuid.uuid1()).replace("-", ""),
-    )
-    Meta = type("Meta", (object,), {"types": tuple(_types)})
-    _union = type(name, (graphene.Union,), {"Meta": Meta})
+    # Reuse the union built for the same field and member types
+    key = (field._owner_document.__name__, field.db_field, tuple(_types))
+    _union = _UNION_CACHE.get(key)
+    if _union is None:
+        # XXX: Suffix with a sequence number to avoid duplicate name
+        cache_seq = len(_UNION_CACHE)
+        name = f"{field._owner_document.__name__}_{field.db_field}_union_{cache_seq}"
+        Meta = type("Meta", (object,), {"types": tuple(_types)})
+        _union = _UNION_CACHE[key] = type(name, (graphene.Union,), {"Meta": Meta})
     return graphene.Field(_union)
 
 
@@ -210,10 +280,12 @@ def convert_field_to_dynamic(field, registry=None):
 @convert_mongoengine_field.register(mongoengine.LazyReferenceField)
 def convert_lazy_field_to_dynamic(field, registry=None):
     model = field.document_type
+    attr_name = field.name or field.db_field
 
     def lazy_resolver(root, *args, **kwargs):
-        if getattr(root, field.name or field.db_name):
-            return getattr(root, field.name or field.db_name).fetch()
+        document = getattr(root, attr_name)
+        if document:
+            return document.fetch()
 
     def dynamic_type():
         _type = registry.get_type_for_model(model)
@@ -1,7 +1,9 @@
 from __future__ import absolute_import
 
+import inspect
 from collections import OrderedDict
-from functools import partial, reduce
+from functools import partial
+from itertools import chain
 
 import graphene
 import mongoengine
@@ -22,10 +24,38 @@ from .advanced_types import (
 )
 from .converter import convert_mongoengine_field, MongoEngineConversionError
 from .registry import get_global_registry
-from .utils import get_model_reference_fields, get_node_from_global_id
+from .utils import (
+    get_model_reference_fields,
+    get_nodes_from_global_ids,
+    get_queryset_slice,
+)
+
+
+# Types of fields which can't be used as filters
+_COMPLEX_TYPES = (
+    FileFieldType,
+    PointFieldType,
+    MultiPolygonFieldType,
+    graphene.Union,
+    PolygonFieldType,
+)
+
+# Pagination args handled by connection_from_list_slice
+_CONNECTION_ARGS = ("first", "last", "before", "after")
+
+# Filters taking a list of values
+_LIST_FILTERS = frozenset(("in", "nin", "all"))
+
+# Field, filter and reference args are the same for every connection field of a
+# given node type, so they're computed once per (connection field class, node type).
+# They depend on the registered types, so the registry clears them on register.
+_NODE_ARGS_CACHE = {}
 
 
 class MongoengineConnectionField(ConnectionField):
+    # Cached properties are kept in the instance __dict__ inherited from graphene
+    __slots__ = ("_get_queryset", "_base_args", "_args")
+
     def __init__(self, type, *args, **kwargs):
         get_queryset = kwargs.pop("get_queryset", None)
         if get_queryset:
@@ -66,64 +96,63 @@ class MongoengineConnectionField(ConnectionField):
 
     @property
     def args(self):
-        # Add a search argument if the node type is marked as searchable
-        # We also add an 'order_by' argument
-        extra_args = {'order_by': graphene.String()}
-        if (self.searchable): extra_args['search'] = graphene.String()
-        return to_arguments(
-            self._base_args or OrderedDict(),
-            {
-                **self.field_args,
-                **self.filter_args,
-                **self.reference_args,
-                **extra_args
-            }
-        )
+        # Computed once per node args cache entry, the setter resets it
+        key = (type(self), self.node_type)
+        if self._args is None or self._args[0] is not _NODE_ARGS_CACHE.get(key):
+            # Add a search argument if the node type is marked as searchable
+            # We also add an 'order_by' argument
+            extra_args = OrderedDict(order_by=graphene.String())
+            if (self.searchable): extra_args['search'] = graphene.String()
+            field_args = self.field_args
+            filter_args = self.filter_args
+            reference_args = self.reference_args
+            # The node args are shared, so their creation counters say nothing
+            # about the order; lay the arguments out explicitly instead.
+            node_args = OrderedDict.fromkeys(
+                chain(extra_args, field_args, filter_args, reference_args)
+            )
+            for group in (field_args, filter_args, reference_args, extra_args):
+                node_args.update(group)
+            # Converted separately so the node args keep their order, which means
+            # name clashes with the base (pagination) args have to be checked here
+            arguments = to_arguments(self._base_args or OrderedDict())
+            for name, argument in to_arguments(node_args).items():
+                assert (
+                    name not in arguments
+                ), 'More than one Argument have same name "{}".'.format(name)
+                arguments[name] = argument
+            self._args = (_NODE_ARGS_CACHE[key], arguments)
+        return self._args[1]
 
     @args.setter
     def args(self, args):
         self._base_args = args
+        self._args = None
 
     def _field_args(self, items):
-        def is_filterable(k):
+        def is_filterable(converted):
             """
             Remove complex columns from input args at this moment.
 
             Args:
-                k (str): field name.
+                converted: the converted field.
             Returns:
                 bool
             """
 
-            if not hasattr(self.model, k):
-                return False
-            if isinstance(getattr(self.model, k), property):
-                return False
-            try:
-                converted = convert_mongoengine_field(
-                    getattr(self.model, k), self.registry
-                )
-            except MongoEngineConversionError:
-                return False
             if isinstance(converted, (ConnectionField, Dynamic)):
                 return False
-            if callable(getattr(converted, "type", None)) and isinstance(
-                converted.type(),
-                (
-                    FileFieldType,
-                    PointFieldType,
-                    MultiPolygonFieldType,
-                    graphene.Union,
-                    PolygonFieldType,
-                ),
+            converted_type = getattr(converted, "type", None)
+            if inspect.isclass(converted_type) and issubclass(
+                converted_type, _COMPLEX_TYPES
             ):
                 return False
             # Fix to https://github.com/graphql-python/graphene-mongo/issues/162
             if isinstance(converted, (graphene.List)) and not issubclass(
                 getattr(converted, "_of_type", None), graphene.Scalar):
                 return False
-            if getattr(converted, "type", None) and getattr(converted.type, "_of_type", None) and not issubclass(
-                    (get_type(converted.type.of_type)), graphene.Scalar):
+            if converted_type and getattr(converted_type, "_of_type", None) and not issubclass(
+                    (get_type(converted_type.of_type)), graphene.Scalar):
                 return False
 
             return True
@@ -136,74 +165,111 @@ class MongoengineConnectionField(ConnectionField):
                 return get_filter_type(_type.of_type)
             return _type()
 
-        return {k: get_filter_type(v.type) for k, v in items if is_filterable(k)}
+        field_args = {}
+        for k, v in items:
+            # Cheap rejects first, only model fields are worth converting
+            mongo_field = getattr(self.model, k, None)
+            if mongo_field is None or isinstance(mongo_field, property):
+                continue
+            try:
+                converted = convert_mongoengine_field(mongo_field, self.registry)
+            except MongoEngineConversionError:
+                continue
+            if is_filterable(converted):
+                field_args[k] = get_filter_type(v.type)
+        return field_args
+
+    def _node_args(self, name, compute, *args):
+        node_args = _NODE_ARGS_CACHE.setdefault((type(self), self.node_type), {})
+        if name not in node_args:
+            node_args[name] = compute(*args)
+        return node_args[name]
+
+    @classmethod
+    def invalidate_cache(cls):
+        _NODE_ARGS_CACHE.clear()
 
     @property
     def field_args(self):
-        return self._field_args(self.fields.items())
+        return self._node_args("field_args", self._field_args, self.fields.items())
 
     @property
     def filter_args(self):
+        return self._node_args("filter_args", self._filter_args)
+
+    @property
+    def reference_args(self):
+        return self._node_args("reference_args", self._reference_args)
+
+    def _filter_args(self):
         filter_args = dict()
         if self._type._meta.filter_fields:
+            fields = self._type._meta.fields
             for field, filter_collection in self._type._meta.filter_fields.items():
-                for each in filter_collection:
-                    filter_type = self._type._meta.fields[field].type
-                    # Convert to scalar
-                    while isinstance(filter_type, Structure):
-                        filter_type = filter_type._of_type
+                scalar_type = fields[field].type
+                # Convert to scalar
+                while isinstance(scalar_type, Structure):
+                    scalar_type = scalar_type._of_type
 
+                for each in filter_collection:
                     # handle special cases
-                    advanced_filter_types = {
-                        "in": graphene.List(filter_type),
-                        "nin": graphene.List(filter_type),
-                        "all": graphene.List(filter_type),
-                    }
-
-                    filter_type = advanced_filter_types.get(each, filter_type)
+                    if each in _LIST_FILTERS:
+                        filter_type = graphene.List(scalar_type)
+                    else:
+                        filter_type = scalar_type
                     filter_args[field + "__" + each] = graphene.Argument(
                         type=filter_type
                     )
 
         return filter_args
 
-    @property
-    def reference_args(self):
-        def get_reference_field(r, kv):
-            field = kv[1]
-            mongo_field = getattr(self.model, kv[0], None)
+    def _reference_args(self):
+        reference_args = {}
+        for name, field in self.fields.items():
+            mongo_field = getattr(self.model, name, None)
             if isinstance(
                 mongo_field,
                 (mongoengine.LazyReferenceField, mongoengine.ReferenceField),
             ):
                 field = convert_mongoengine_field(mongo_field, self.registry)
-            if callable(getattr(field, "get_type", None)):
-                _type = field.get_type()
-                if _type:
-                    node = _type._type._meta
-                    if "id" in node.fields and not issubclass(
-                        node.model, (mongoengine.EmbeddedDocument,)
-                    ):
-                        r.update({kv[0]: node.fields["id"]._type.of_type()})
-            return r
-
-        return reduce(get_reference_field, self.fields.items(), {})
+            if not callable(getattr(field, "get_type", None)):
+                continue
+            _type = field.get_type()
+            if _type:
+                node = _type._type._meta
+                if "id" in node.fields and not issubclass(
+                    node.model, (mongoengine.EmbeddedDocument,)
+                ):
+                    reference_args[name] = node.fields["id"]._type.of_type()
+        return reference_args
 
     @property
     def fields(self):
-        return self._type._meta.fields
+        fields = self.__dict__.get("fields")
+        if fields is None:
+            fields = self.__dict__["fields"] = self._type._meta.fields
+        return fields
+
+    @property
+    def _reference_fields(self):
+        reference_fields = self.__dict__.get("_reference_fields")
+        if reference_fields is None:
+            reference_fields = self.__dict__["_reference_fields"] = (
+                get_model_reference_fields(self.model)
+            )
+        return reference_fields
 
     def get_queryset(self, model, info, **args):
         if args:
-            reference_fields = get_model_reference_fields(self.model)
-            hydrated_references = {}
-            for arg_name, arg in args.copy().items():
-                if arg_name in reference_fields:
-                    reference_obj = get_node_from_global_id(
-                        reference_fields[arg_name], info, args.pop(arg_name)
-                    )
-                    hydrated_references[arg_name] = reference_obj
-            args.update(hydrated_references)
+            reference_fields = self._reference_fields
+            reference_args = {
+                arg_name: args[arg_name]
+                for arg_name in args.keys() & reference_fields.keys()
+            }
+            if reference_args:
+                args.update(
+                    get_nodes_from_global_ids(reference_fields, info, reference_args)
+                )
 
         # Allow user to override base queryset using _get_queryset
         # Users can also override filters by providing a dict to get_queryset
@@ -237,12 +303,7 @@ class MongoengineConnectionField(ConnectionField):
         if _root is not None:
             args["pk__in"] = [r.pk for r in getattr(_root, info.field_name, [])]
 
-        connection_args = {
-            "first": args.pop("first", None),
-            "last": args.pop("last", None),
-            "before": args.pop("before", None),
-            "after": args.pop("after", None),
-        }
+        connection_args = {key: args.pop(key, None) for key in _CONNECTION_ARGS}
 
         _id = args.pop('id', None)
 
@@ -251,21 +312,31 @@ class MongoengineConnectionField(ConnectionField):
 
         if callable(getattr(self.model, "objects", None)):
             iterables = self.get_queryset(self.model, info, **args)
-            list_length = iterables.count()
         else:
             iterables = []
-            list_length = 0
 
+        return self._connection_from_iterable(self.type, connection_args, iterables)
+
+    @staticmethod
+    def _connection_from_iterable(connection_type, args, iterable):
+        if isinstance(iterable, list):
+            list_slice, slice_start, list_length = iterable, 0, len(iterable)
+        else:
+            list_slice, slice_start, list_length = get_queryset_slice(iterable, args)
+
+        slice_end = slice_start + len(list_slice)
         connection = connection_from_list_slice(
-            list_slice=iterables,
-            args=connection_args,
-            list_length=list_length,
-            list_slice_length=list_length,
-            connection_type=self.type,
-            edge_type=self.type.Edge,
+            list_slice=list_slice,
+            args=args,
+            slice_start=slice_start,
+            # Without a count, the end of the fetched documents bounds the list
+            list_length=list_length if isinstance(list_length, int) else slice_end,
+            list_slice_length=len(list_slice),
+            connection_type=connection_type,
+            edge_type=connection_type.Edge,
             pageinfo_type=graphene.PageInfo,
         )
-        connection.iterable = iterables
+        connection.iterable = iterable
         connection.list_length = list_length
         return connection
 
@@ -277,6 +348,15 @@ class MongoengineConnectionField(ConnectionField):
                 return resolved
         return self.default_resolver(root, info, **args)
 
+    @classmethod
+    def resolve_connection(cls, connection_type, args, resolved):
+        # Only fetch the requested page of querysets returned by custom resolvers
+        if isinstance(resolved, mongoengine.QuerySet):
+            return cls._connection_from_iterable(connection_type, args, resolved)
+        return super(MongoengineConnectionField, cls).resolve_connection(
+            connection_type, args, resolved
+        )
+
     @classmethod
     def connection_resolver(cls, resolver, connection_type, root, info, **args):
         iterable = resolver(root, info, **args)
@@ -1,42 +1,60 @@
 import graphene
+import weakref
 from graphene.utils.thenables import maybe_thenable
 from functools import partial
 
-entry_type_lookup = {}
+# Entry types by value type, dropped once no field uses them anymore
+entry_type_lookup = weakref.WeakValueDictionary()
 
 def get_entry_type(value_type):
-    name = value_type._meta.name
-    entry_type = entry_type_lookup.get(name, None)
+    entry_type = entry_type_lookup.get(value_type, None)
     # Construct new entry type if necessary
     if not entry_type:
-        class Entry(graphene.ObjectType):
-            key = graphene.String()
-            value = graphene.Field(value_type)
-        entry_type = type(f'{name}Entry', (Entry,), {})
-        entry_type_lookup[name] = entry_type
+        entry_type = type(f'{value_type._meta.name}Entry', (graphene.ObjectType,), {
+            'key': graphene.String(),
+            'value': graphene.Field(value_type),
+        })
+        entry_type_lookup[value_type] = entry_type
     return entry_type
 
+
+class _Entry(object):
+    """
+    A resolved map entry, read through attribute access by the entry type's fields.
+    """
+
+    __slots__ = ('key', 'value')
+
+    def __init__(self, key, value):
+        self.key = key
+        self.value = value
+
+
+def resolve_map(resolved):
+    # "Flatten" map
+    return [_Entry(k, v) for (k, v) in resolved.items()]
+
+
 class MapField(graphene.Field):
     """
     A map field can be used to expose a python dict as a list of entries, where each entry has
     a String 'key' and a 'value' of a user-supplied type. Can be used with mongoengine.MapField 
     """
 
+    __slots__ = ()
+
     def __init__(self, value_type, *args, **kw_args):
         # Define field type as entry type
         _type = graphene.List(get_entry_type(value_type))
         super(MapField, self).__init__(_type, *args, **kw_args)
 
-    @classmethod
-    def resolve_map(cls, resolved):
-        # "Flatten" map
-        return [{'key': k, 'value': v} for (k, v) in resolved.items()]
-
     @classmethod
     def map_resolver(cls, resolver, root, info, **args):
         resolved = resolver(root, info, **args)
-        on_resolve = partial(cls.resolve_map)
-        return maybe_thenable(resolved, on_resolve)
+        # Documents hold plain dicts, only go through maybe_thenable for promises
+        if isinstance(resolved, dict):
+            return resolve_map(resolved)
+        return maybe_thenable(resolved, resolve_map)
 
     def get_resolver(self, parent_resolver):
         resolver = super(MapField, self).get_resolver(parent_resolver)
@@ -3,6 +3,8 @@ class Registry(object):
         self._registry = {}
 
     def register(self, cls):
+        from .converter import convert_mongoengine_field
+        from .fields import MongoengineConnectionField
         from .types import MongoengineObjectType
 
         assert issubclass(
@@ -12,6 +14,9 @@ class Registry(object):
         )
         assert cls._meta.registry == self, "Registry for a Model have to match."
         self._registry[cls._meta.model] = cls
+        # Conversions depend on the registered types, drop the cached ones
+        convert_mongoengine_field.cache_clear()
+        MongoengineConnectionField.invalidate_cache()
 
         # Rescan all fields
         for model, cls in self._registry.items():
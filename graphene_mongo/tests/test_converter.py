@@ -1,3 +1,6 @@
+import gc
+import weakref
+
 import graphene
 import mongoengine
 from py.test import raises
@@ -15,6 +18,7 @@ from .models import (
 )
 from .. import registry
 from .. import advanced_types
+from .. import converter
 from ..converter import convert_mongoengine_field
 from ..fields import MongoengineConnectionField
 from ..helper_fields import MapField
@@ -354,6 +358,13 @@ def test_should_generic_reference_convert_union():
     assert isinstance(generic_reference_field.type(), graphene.Union)
     assert generic_reference_field.type()._meta.types == (A, E)
 
+    # The union type is reused when converting again
+    convert_mongoengine_field.cache_clear()
+    converted_again = convert_mongoengine_field(
+        Reporter._fields["generic_reference"], registry.get_global_registry()
+    )
+    assert converted_again.type is generic_reference_field.type
+
 
 def test_should_generic_embedded_document_convert_union():
     class D(MongoengineObjectType):
@@ -382,3 +393,49 @@ def test_should_generic_embedded_document_convert_union():
     assert isinstance(generic_embedded_document, graphene.Field)
     assert isinstance(generic_embedded_document.type(), graphene.Union)
     assert generic_embedded_document.type()._meta.types == (D, F)
+
+
+def test_should_memoize_conversion_per_registry():
+    field = mongoengine.StringField()
+    converted = convert_mongoengine_field(field, registry.get_global_registry())
+    assert convert_mongoengine_field(field, registry.get_global_registry()) is converted
+    assert convert_mongoengine_field(field, registry.Registry()) is not converted
+
+    convert_mongoengine_field.cache_clear()
+    assert convert_mongoengine_field(field, registry.get_global_registry()) is not converted
+
+
+def test_should_not_keep_dynamic_conversion_field_alive():
+    field = mongoengine.ReferenceField(Reporter)
+    field_ref = weakref.ref(field)
+    assert isinstance(convert_mongoengine_field(field), graphene.Dynamic)
+
+    del field
+    gc.collect()
+    assert field_ref() is None
+
+
+def test_should_field_subclass_convert_as_base_field():
+    class CustomStringField(mongoengine.StringField):
+        pass
+
+    assert_conversion(CustomStringField, graphene.String)
+
+
+def test_should_register_converter_drop_cached_conversions():
+    class CustomStringField(mongoengine.StringField):
+        pass
+
+    field = CustomStringField()
+    assert isinstance(convert_mongoengine_field(field), graphene.String)
+
+    try:
+        @convert_mongoengine_field.register(CustomStringField)
+        def convert_custom_string_field_to_int(field, registry=None):
+            return graphene.Int()
+
+        assert isinstance(convert_mongoengine_field(field), graphene.Int)
+    finally:
+        converter._CONVERTERS.pop(CustomStringField, None)
+        converter._MRO_CACHE.clear()
+        convert_mongoengine_field.cache_clear()
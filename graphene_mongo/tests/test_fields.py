@@ -1,5 +1,13 @@
+import mongoengine
+from graphene.relay import Node
+from py.test import raises
+
 from . import nodes
+from .models import Article, Reporter
+from .utils import with_local_registry
 from ..fields import MongoengineConnectionField
+from ..types import MongoengineObjectType
+from ..utils import LazyCount
 
 
 def test_article_field_args():
@@ -57,3 +65,86 @@ def test_default_resolver_connection_list_length(fixtures):
     connection = field.default_resolver(None, {}, **{"first": 1})
     assert hasattr(connection, "list_length")
     assert connection.list_length == 3
+
+
+def test_field_args_are_cached():
+    field = MongoengineConnectionField(nodes.ArticleNode)
+
+    assert field.field_args is field.field_args
+    args = field.args
+    assert field.args is args
+
+    field.args = {}
+    assert field.args is not args
+    assert set(field.args) == {"id", "headline", "pub_date", "editor", "reporter", "order_by"}
+
+
+def test_default_resolver_connection_lazy_list_length(fixtures):
+    field = MongoengineConnectionField(nodes.ArticleNode)
+
+    connection = field.default_resolver(None, {}, **{"first": 2})
+    assert isinstance(connection.list_length, LazyCount)
+    assert len(connection.edges) == 2
+    assert connection.page_info.has_next_page
+    assert connection.list_length == 3
+    assert connection.list_length - 1 == 2
+    assert 1 + connection.list_length == 4
+
+    connection = field.default_resolver(None, {}, **{"first": 5})
+    assert len(connection.edges) == 3
+    assert not connection.page_info.has_next_page
+    assert connection.list_length == 3
+
+
+def test_field_args_are_shared_per_node_type():
+    field_args = MongoengineConnectionField(nodes.ArticleNode).field_args
+    assert MongoengineConnectionField(nodes.ArticleNode).field_args is field_args
+
+    MongoengineConnectionField.invalidate_cache()
+    assert MongoengineConnectionField(nodes.ArticleNode).field_args is not field_args
+
+
+def test_args_follow_field_args_cache():
+    field = MongoengineConnectionField(nodes.ArticleNode)
+    args = field.args
+    assert field.args is args
+    names = list(args)
+    assert names.index("order_by") < names.index("headline") < names.index("editor")
+
+    MongoengineConnectionField.invalidate_cache()
+    assert field.args is not args
+
+
+@with_local_registry
+def test_reference_args_follow_registry():
+    class A(MongoengineObjectType):
+        class Meta:
+            model = Article
+            interfaces = (Node,)
+
+    field = MongoengineConnectionField(A)
+    assert "reporter" not in field.reference_args
+    assert "reporter" not in field.args
+
+    class R(MongoengineObjectType):
+        class Meta:
+            model = Reporter
+            interfaces = (Node,)
+
+    assert "reporter" in field.reference_args
+    assert "reporter" in field.args
+
+
+@with_local_registry
+def test_field_args_clashing_with_connection_args():
+    class Thing(mongoengine.Document):
+        last = mongoengine.StringField()
+
+    class ThingNode(MongoengineObjectType):
+        class Meta:
+            model = Thing
+            interfaces = (Node,)
+
+    with raises(AssertionError) as excinfo:
+        MongoengineConnectionField(ThingNode).args
+    assert 'More than one Argument have same name "last"' in str(excinfo.value)
@@ -1096,3 +1096,83 @@ def test_should_filter_mongoengine_queryset_by_id_and_other_fields(fixtures):
 
     assert not result.errors
     assert json.dumps(result.data, sort_keys=True) == json.dumps(expected, sort_keys=True)
+
+
+def test_should_paginate_queryset_returned_by_resolver(fixtures):
+    class Query(graphene.ObjectType):
+        articles = MongoengineConnectionField(nodes.ArticleNode)
+
+        def resolve_articles(self, *args, **kwargs):
+            return models.Article.objects(headline__ne="Hello").order_by("headline")
+
+    query = """
+        query ArticlesQuery {
+            articles(first: 1) {
+                edges {
+                    node {
+                        headline
+                    }
+                }
+                pageInfo {
+                    hasNextPage
+                }
+            }
+        }
+    """
+    expected = {
+        "articles": {
+            "edges": [{"node": {"headline": "Bye"}}],
+            "pageInfo": {"hasNextPage": True},
+        }
+    }
+    schema = graphene.Schema(query=Query)
+    result = schema.execute(query)
+    assert not result.errors
+    assert result.data == expected
+
+
+def test_should_paginate_within_skip_and_limit_of_resolver_queryset(fixtures):
+    class Query(graphene.ObjectType):
+        articles = MongoengineConnectionField(nodes.ArticleNode)
+
+        def resolve_articles(self, *args, **kwargs):
+            return models.Article.objects.order_by("headline").skip(1).limit(1)
+
+    query = """
+        query ArticlesQuery {
+            first: articles(first: 2) {
+                edges {
+                    node {
+                        headline
+                    }
+                }
+                pageInfo {
+                    hasNextPage
+                }
+            }
+            last: articles(last: 1) {
+                edges {
+                    node {
+                        headline
+                    }
+                }
+                pageInfo {
+                    hasPreviousPage
+                }
+            }
+        }
+    """
+    expected = {
+        "first": {
+            "edges": [{"node": {"headline": "Hello"}}],
+            "pageInfo": {"hasNextPage": False},
+        },
+        "last": {
+            "edges": [{"node": {"headline": "Hello"}}],
+            "pageInfo": {"hasPreviousPage": False},
+        },
+    }
+    schema = graphene.Schema(query=Query)
+    result = schema.execute(query)
+    assert not result.errors
+    assert result.data == expected
@@ -75,6 +75,10 @@ def test_mongoengine_inheritance():
     assert issubclass(Son._meta.model, Dad._meta.model)
 
 
+def test_mongoengine_inheritance_field_order():
+    assert list(Son._meta.fields) == ["_cls", "bar", "baz", "id", "loc"]
+
+
 def test_node_replacedfield():
     idfield = Human._meta.fields["pub_date"]
     assert isinstance(idfield, Field)
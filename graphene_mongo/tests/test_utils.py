@@ -1,5 +1,11 @@
-from ..utils import get_model_fields, is_valid_mongoengine_model
-from .models import Article, Reporter, Child
+import graphene
+from graphene.relay import Node
+from py.test import raises
+
+from . import nodes
+from ..fields import MongoengineConnectionField
+from ..utils import get_model_fields, get_nodes_from_global_ids, is_valid_mongoengine_model
+from .models import Article, Editor, Reporter, Child
 
 
 def test_get_model_fields_no_duplication():
@@ -36,3 +42,41 @@ def test_get_base_model_fields():
 
 def test_is_valid_mongoengine_mode():
     assert is_valid_mongoengine_model(Reporter)
+
+
+def test_get_nodes_from_global_ids(fixtures):
+    class Query(graphene.ObjectType):
+        editors = MongoengineConnectionField(nodes.EditorNode)
+
+    class Info(object):
+        schema = graphene.Schema(query=Query)
+
+    field = Article._fields["editor"]
+    global_ids = {
+        "first": Node.to_global_id("EditorNode", "1"),
+        "second": Node.to_global_id("EditorNode", "2"),
+    }
+    resolved = get_nodes_from_global_ids(
+        {"first": field, "second": field}, Info, global_ids
+    )
+    assert resolved["first"] == Editor.objects.get(pk="1")
+    assert resolved["second"] == Editor.objects.get(pk="2")
+
+    with raises(Editor.DoesNotExist):
+        get_nodes_from_global_ids(
+            {"missing": field}, Info, {"missing": Node.to_global_id("EditorNode", "9")}
+        )
+
+
+def test_get_nodes_from_global_ids_converts_pk(fixtures):
+    class Query(graphene.ObjectType):
+        articles = MongoengineConnectionField(nodes.ArticleNode)
+
+    class Info(object):
+        schema = graphene.Schema(query=Query)
+
+    field = Reporter._fields["articles"].field
+    article = Article.objects.first()
+    global_id = Node.to_global_id("ArticleNode", str(article.pk).upper())
+    resolved = get_nodes_from_global_ids({"article": field}, Info, {"article": global_id})
+    assert resolved["article"] == article
@@ -111,8 +111,10 @@ class MongoengineObjectType(ObjectType):
         converted_fields, self_referenced = construct_fields(
             model, registry, only_fields, exclude_fields
         )
+        # Converted fields may be shared with other types (e.g. inherited documents),
+        # so keep the model order instead of sorting by creation counter
         mongoengine_fields = yank_fields_from_attrs(
-            converted_fields, _as=graphene.Field
+            converted_fields, _as=graphene.Field, sort=False
         )
         if use_connection is None and interfaces:
             use_connection = any(
@@ -174,7 +176,7 @@ class MongoengineObjectType(ObjectType):
             )
             if converted_fields:
                 mongoengine_fields = yank_fields_from_attrs(
-                    converted_fields, _as=graphene.Field
+                    converted_fields, _as=graphene.Field, sort=False
                 )
                 cls._meta.fields.update(mongoengine_fields)
                 registry.register(cls)
@@ -190,8 +192,10 @@ class MongoengineObjectType(ObjectType):
             cls._meta.exclude_fields,
         )
 
+        # Converted fields may be shared with other types (e.g. inherited documents),
+        # so keep the model order instead of sorting by creation counter
         mongoengine_fields = yank_fields_from_attrs(
-            converted_fields, _as=graphene.Field
+            converted_fields, _as=graphene.Field, sort=False
         )
 
         # The initial scan should take precedence
@@ -1,11 +1,15 @@
 from __future__ import unicode_literals
 
 import inspect
-from collections import OrderedDict
+import weakref
+from collections import OrderedDict, defaultdict
+from functools import total_ordering
 
 import mongoengine
 from graphene import Node
 from graphene.utils.trim_docstring import trim_docstring
+from graphql_relay import from_global_id
+from graphql_relay.connection.arrayconnection import get_offset_with_default
 
 
 def get_model_fields(model, excluding=None):
@@ -38,29 +42,6 @@ def is_valid_mongoengine_model(model):
     )
 
 
-def import_single_dispatch():
-    try:
-        from functools import singledispatch
-    except ImportError:
-        singledispatch = None
-
-    if not singledispatch:
-        try:
-            from singledispatch import singledispatch
-        except ImportError:
-            pass
-
-    if not singledispatch:
-        raise Exception(
-            "It seems your python version does not include "
-            "functools.singledispatch. Please install the 'singledispatch' "
-            "package. More information here: "
-            "https://pypi.python.org/pypi/singledispatch"
-        )
-
-    return singledispatch
-
-
 # noqa
 def get_type_for_document(schema, document):
     types = schema.types.values()
@@ -72,12 +53,20 @@ def get_type_for_document(schema, document):
             return _type
 
 
+# Descriptions by field, dropped together with the field
+_FIELD_DESCRIPTIONS = weakref.WeakKeyDictionary()
+
+
 def get_field_description(field, registry=None):
     """
     Common metadata includes verbose_name and help_text.
 
     http://docs.mongoengine.org/apireference.html#fields
     """
+    description = _FIELD_DESCRIPTIONS.get(field)
+    if description is not None:
+        return description
+
     parts = []
     if hasattr(field, "document_type"):
         doc = trim_docstring(field.document_type.__doc__)
@@ -91,7 +80,8 @@ def get_field_description(field, registry=None):
         name_format = "(%s)" if parts else "%s"
         parts.append(name_format % field.db_field)
 
-    return "\n".join(parts)
+    description = _FIELD_DESCRIPTIONS[field] = "\n".join(parts)
+    return description
 
 
 def get_node_from_global_id(node, info, global_id):
@@ -101,3 +91,184 @@ def get_node_from_global_id(node, info, global_id):
                 return interface.get_node_from_global_id(info, global_id)
     except AttributeError:
         return Node.get_node_from_global_id(info, global_id)
+
+
+def get_nodes_from_global_ids(nodes, info, global_ids):
+    """
+    Resolves several global ids at once, with a single query per model.
+
+    Args:
+        nodes (dict): node (as passed to get_node_from_global_id) by key.
+        info (graphql.ResolveInfo):
+        global_ids (dict): global id by key.
+
+    Returns:
+        dict: resolved object by key. Ids of types which don't use the default
+        MongoengineObjectType.get_node are resolved one by one through
+        get_node_from_global_id.
+    """
+    from .types import MongoengineObjectType
+
+    resolved = {}
+    pks_by_type = defaultdict(dict)
+    for key, global_id in global_ids.items():
+        try:
+            _type, _id = from_global_id(global_id)
+            graphene_type = info.schema.get_type(_type).graphene_type
+        except Exception:
+            graphene_type = None
+        if (
+            inspect.isclass(graphene_type)
+            and issubclass(graphene_type, MongoengineObjectType)
+            and Node in graphene_type._meta.interfaces
+            and graphene_type.get_node.__func__ is MongoengineObjectType.get_node.__func__
+        ):
+            pks_by_type[graphene_type][key] = _id
+        else:
+            resolved[key] = get_node_from_global_id(nodes[key], info, global_id)
+
+    for graphene_type, pks in pks_by_type.items():
+        model = graphene_type._meta.model
+        # Decoded ids are strings, convert them the way the pk field would
+        id_field = model._fields[model._meta["id_field"]]
+        pks = {key: id_field.to_python(pk) for key, pk in pks.items()}
+        documents = {
+            document.pk: document
+            for document in model.objects(pk__in=list(pks.values()))
+        }
+        for key, pk in pks.items():
+            if pk not in documents:
+                raise model.DoesNotExist(
+                    "%s matching query does not exist." % model._class_name
+                )
+            resolved[key] = documents[pk]
+    return resolved
+
+
+@total_ordering
+class LazyCount(object):
+    """
+    Integer-like length of a queryset, counted the first time the value is used.
+
+    Connections keep it as their list_length, so it supports comparisons and
+    arithmetic with ints; anything that needs a real int should call int() on it.
+    """
+
+    def __init__(self, queryset):
+        self._queryset = queryset
+        self._count = None
+
+    def __int__(self):
+        if self._count is None:
+            self._count = self._queryset.count(with_limit_and_skip=True)
+        return self._count
+
+    __index__ = __int__
+
+    def __bool__(self):
+        return bool(int(self))
+
+    def __eq__(self, other):
+        return int(self) == other
+
+    def __lt__(self, other):
+        return int(self) < other
+
+    def __hash__(self):
+        return hash(int(self))
+
+    def __add__(self, other):
+        return int(self) + other
+
+    def __radd__(self, other):
+        return other + int(self)
+
+    def __sub__(self, other):
+        return int(self) - other
+
+    def __rsub__(self, other):
+        return other - int(self)
+
+    def __mul__(self, other):
+        return int(self) * other
+
+    __rmul__ = __mul__
+
+    def __floordiv__(self, other):
+        return int(self) // other
+
+    def __rfloordiv__(self, other):
+        return other // int(self)
+
+    def __truediv__(self, other):
+        return int(self) / other
+
+    def __rtruediv__(self, other):
+        return other / int(self)
+
+    def __neg__(self):
+        return -int(self)
+
+    def __float__(self):
+        return float(int(self))
+
+    def __repr__(self):
+        return repr(int(self))
+
+
+def get_queryset_slice(queryset, args):
+    """
+    Fetches the documents covered by the connection args with a single query.
+
+    Args:
+        queryset (mongoengine.QuerySet):
+        args (dict): connection args (first, last, before and after).
+
+    Returns:
+        (list, int, int): the fetched documents, the offset of the first one and the
+        length of the whole queryset. The queryset is counted up front when paginating
+        with last. Otherwise one more document than the page is fetched to tell whether
+        the list goes on, and the length is a LazyCount unless the end was reached.
+        A skip or limit already set on the queryset bounds the list.
+    """
+    first = args.get("first")
+    last = args.get("last")
+    start = get_offset_with_default(args.get("after"), -1) + 1
+    end = get_offset_with_default(args.get("before"), None)
+
+    list_length = None
+    if isinstance(last, int):
+        list_length = queryset.count(with_limit_and_skip=True)
+        end = list_length if end is None else min(end, list_length)
+    if isinstance(first, int):
+        end = start + first if end is None else min(end, start + first)
+    if isinstance(last, int):
+        start = max(start, end - last)
+
+    # skip() and limit() replace the queryset's own, so apply them on top of those
+    skip = (queryset._skip or 0) + start
+    # A limit of 0 on the queryset means no limit at all
+    available = queryset._limit - start if queryset._limit else None
+    if end is None:
+        limit = available
+        exhausted = True
+    else:
+        wanted = end - start + (0 if list_length is not None else 1)
+        limit = wanted if available is None else min(wanted, available)
+        exhausted = 0 < wanted and available is not None and available < wanted
+    if limit is None:
+        list_slice = list(queryset.skip(skip))
+    else:
+        # Note a limit of 0 would mean no limit at all
+        list_slice = list(queryset.skip(skip).limit(limit)) if limit > 0 else []
+        exhausted = exhausted or 0 < limit and len(list_slice) < limit
+
+    if list_length is None:
+        if list_slice and not exhausted:
+            list_length = LazyCount(queryset)
+        elif list_slice or (exhausted and start == 0):
+            list_length = start + len(list_slice)
+        else:
+            # Nothing to tell from, like a page past the end of the queryset
+            list_length = queryset.count(with_limit_and_skip=True)
+    return list_slice, start, list_length
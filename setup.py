@@ -26,7 +26,6 @@ setup(
     install_requires=[
         "graphene>=2.1.3,<3",
         "mongoengine>=0.15.0",
-        "singledispatch>=3.4.0.3",
         "iso8601>=0.1.12",
     ],
     python_requires=">=2.7",